@@ -0,0 +1,89 @@
+"""Benchmark size and throughput of pack_many/unpack_many against pickle
+
+Formats:
+:dict: pickle of attribute dicts, as objects were pickled before they defined __reduce__
+:pickle: pickle using __reduce__ of Point, Car and Unit
+:codec: pack_many/unpack_many
+
+Usage: python -m benchmarks.codec [number of objects, 1000000 by default]
+"""
+
+__author__ = 'santa'
+
+from src.car import Car
+from src.codec import pack_many, unpack_many
+from src.point import Point
+from src.unit import Unit
+from contextlib import contextmanager
+from time import perf_counter
+import gc
+import pickle
+import random
+import sys
+
+
+def _timed(function, *args):
+    start = perf_counter()
+    result = function(*args)
+    return result, perf_counter() - start
+
+
+def _dumps(objects):
+    return pickle.dumps(objects, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@contextmanager
+def _default_pickling(classes):
+    """
+    Remove __reduce__, __getstate__ and __setstate__ from classes while inside block,
+    so their objects are pickled as dicts of attributes like before they defined them.
+
+    :param classes: Classes defining compact pickling
+    :type classes: Iterable of type
+    """
+
+    methods = ('__reduce__', '__getstate__', '__setstate__')
+    saved = {cls: {name: cls.__dict__[name] for name in methods} for cls in classes}
+    for cls in saved:
+        for name in methods:
+            delattr(cls, name)
+    try:
+        yield
+    finally:
+        for cls, defined in saved.items():
+            for name, method in defined.items():
+                setattr(cls, name, method)
+
+
+def _timed_default(function, *args):
+    with _default_pickling((Point, Car, Unit)):
+        return _timed(function, *args)
+
+
+def main(size=10 ** 6):
+    random.seed(1)
+    samples = {
+        'Point': [Point(random.random(), random.random()) for _ in range(size)],
+        'Car': [
+            Car(60, 0.6, Point(random.random(), random.random()), random.choice(('BMW', 'Taz', 'Mercedes')))
+            for _ in range(size)
+        ],
+        'Unit': [Unit(random.choice(('Archer', 'Knight')), random.randint(1, 300), 40) for _ in range(size)],
+    }
+
+    gc.disable()
+    print(f'{"":>6} {"format":>7} {"B/obj":>6} {"dump, s":>8} {"load, s":>8}')
+    for name, objects in samples.items():
+        for format_name, timed, dump, load in (
+            ('dict', _timed_default, _dumps, pickle.loads),
+            ('pickle', _timed, _dumps, pickle.loads),
+            ('codec', _timed, pack_many, unpack_many),
+        ):
+            data, dumped = timed(dump, objects)
+            _, loaded = timed(load, data)
+            print(f'{name:>6} {format_name:>7} {len(data) / size:>6.1f} {dumped:>8.2f} {loaded:>8.2f}')
+    gc.enable()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""Benchmark geometry aggregates on PointArray against list of Point and streaming BoundingBox updates
+
+Usage: python -m benchmarks.geometry [number of points, 1000000 by default]
+"""
+
+__author__ = 'santa'
+
+from src.geometry import BoundingBox, PointArray, bounding_box, centroid, convex_hull
+from src.point import Point
+from time import perf_counter
+import random
+import sys
+
+
+def _timed(function, *args):
+    start = perf_counter()
+    function(*args)
+    return perf_counter() - start
+
+
+def _stream(box, moves):
+    """
+    Move tracked points and read box once after all moves.
+
+    :param box: Box tracking points
+    :type box: BoundingBox
+    :param moves: Keys of points and their new positions
+    :type moves: list of tuple
+    :return: None
+    :rtype: None
+    """
+
+    update = box.update
+    for key, point in moves:
+        update(key, point)
+    box.lower
+
+
+def main(size=10 ** 6):
+    random.seed(1)
+    points = [Point(random.uniform(-1e3, 1e3), random.uniform(-1e3, 1e3)) for _ in range(size)]
+    array = PointArray.from_points(points)
+
+    print(f'{size} points')
+    print(f'{"":>10} {"PointArray, s":>14} {"list, s":>8}')
+    for name, function in (('bbox', bounding_box), ('centroid', centroid), ('hull', convex_hull)):
+        print(f'{name:>10} {_timed(function, array):>14.3f} {_timed(function, points):>8.3f}')
+
+    box = BoundingBox()
+    for key, point in enumerate(points):
+        box.update(key, point)
+    moves = [
+        (random.randrange(size), Point(random.uniform(-1e3, 1e3), random.uniform(-1e3, 1e3)))
+        for _ in range(size)
+    ]
+    print(f'streaming bbox, {size} updates and read: {_timed(_stream, box, moves):.3f} s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,41 @@
+"""Benchmark cost of SnapshotStore.snapshot and of first copy-on-write against collection size
+
+Usage: python -m benchmarks.snapshot
+"""
+
+__author__ = 'santa'
+
+from src.car import Car
+from src.snapshot import SnapshotStore
+from time import perf_counter
+
+SIZES = (10 ** 4, 10 ** 5, 10 ** 6)
+REPEAT = 1000
+
+
+def main():
+    print(f'{"objects":>10} {"snapshot, us":>14} {"first write, us":>16} {"next write, us":>15}')
+    for size in SIZES:
+        cars = [Car() for _ in range(size)]
+        store = SnapshotStore(cars)
+
+        start = perf_counter()
+        for _ in range(REPEAT):
+            store.snapshot()
+        snapshot = (perf_counter() - start) / REPEAT
+
+        store.snapshot()
+        start = perf_counter()
+        cars[0].refill(1)
+        first_write = perf_counter() - start
+
+        start = perf_counter()
+        cars[1].refill(1)
+        next_write = perf_counter() - start
+
+        print(f'{size:>10} {snapshot * 1e6:>14.2f} {first_write * 1e6:>16.1f} {next_write * 1e6:>15.1f}')
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark memory of Unit and CompactUnit with tracemalloc
+
+Usage: python -m benchmarks.unit_memory [number of units, 1000000 by default]
+"""
+
+__author__ = 'santa'
+
+import gc
+import random
+import sys
+import tracemalloc
+import src.unit
+
+NAMES = ('Archer', 'Knight', 'Soldier')
+
+
+def _bytes_per_unit(cls, size):
+    """
+    Measure memory taken by units, not counting list holding them.
+
+    :param cls: Class of units
+    :type cls: type
+    :param size: Number of units
+    :type size: int
+    :return: bytes per unit
+    :rtype: float
+    """
+
+    random.seed(1)
+    gc.collect()
+    tracemalloc.start()
+    # Names are built at runtime, so every unit gets its own str unless names are interned
+    units = [cls(''.join(list(NAMES[index % 3])), random.randint(100, 299), 40) for index in range(size)]
+    for index, unit in enumerate(units[::7]):
+        unit._take_damage(index % 50)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return allocated / size - 8
+
+
+def main(size=10 ** 6):
+    for name in ('Unit', 'CompactUnit'):
+        cls = getattr(src.unit, name, None)
+        if cls is not None:
+            print(f'{name:>12} {_bytes_per_unit(cls, size):>8.1f} B/unit')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,61 @@
+"""Public API of package. Submodules are imported on first access of their names."""
+
+__author__ = 'santa'
+
+from importlib import import_module
+
+_EXPORTS = {
+    'Point': 'src.point',
+    'Car': 'src.car',
+    'Unit': 'src.unit',
+    'UnitIsDead': 'src.unit',
+    'CompactUnit': 'src.unit',
+    'Observable': 'src.observable',
+    'PointArray': 'src.geometry',
+    'BoundingBox': 'src.geometry',
+    'bounding_box': 'src.geometry',
+    'centroid': 'src.geometry',
+    'convex_hull': 'src.geometry',
+    'SharedPoints': 'src.shared',
+    'SharedFleet': 'src.shared',
+    'SharedPoint': 'src.shared',
+    'SharedCar': 'src.shared',
+    'CarState': 'src.snapshot',
+    'UnitState': 'src.snapshot',
+    'Snapshot': 'src.snapshot',
+    'SnapshotStore': 'src.snapshot',
+    'Fleet': 'src.registry',
+    'Army': 'src.registry',
+    'AggregateMismatch': 'src.registry',
+    'pack_many': 'src.codec',
+    'unpack_many': 'src.codec',
+    'MetricSummary': 'src.analytics',
+    'QuantileSketch': 'src.analytics',
+    'FuelEconomyStream': 'src.analytics',
+}
+
+__all__ = tuple(_EXPORTS)
+
+
+def __getattr__(name):
+    """
+    Import submodule defining name and cache name in package namespace.
+
+    :param name: Name of public object
+    :type name: str
+    :raise AttributeError: If there is no such public object
+    :return: public object
+    """
+
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
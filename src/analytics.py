@@ -0,0 +1,357 @@
+"""Define FuelEconomyStream class for windowed per-model statistics of drives and refills"""
+
+__author__ = 'santa'
+__all__ = (
+    'MetricSummary',
+    'QuantileSketch',
+    'FuelEconomyStream',
+)
+
+from bisect import insort
+from collections import deque, namedtuple
+from math import ceil, log
+from time import monotonic
+from src.car import Car
+
+MetricSummary = namedtuple('MetricSummary', ('count', 'total', 'mean', 'quantiles'))
+
+
+class QuantileSketch:
+    """
+    Approximate quantiles of positive values with bounded memory.
+
+    Values are counted in logarithmic bins, so every quantile is returned with relative error
+    not greater than accuracy. When there are more bins than max_bins, lowest bins are collapsed,
+    which only affects accuracy of lowest quantiles.
+
+    Usage:
+    :>>> sketch = QuantileSketch()
+    :>>> for value in range(1, 101):
+    :...     sketch.add(value)
+    :>>> print(round(sketch.quantile(0.5)))
+    50
+    """
+
+    __slots__ = ('_gamma', '_log_gamma', '_max_bins', '_bins', '_keys', '_zeros', '_count')
+
+    def __init__(self, accuracy=0.01, max_bins=2048):
+        """
+        The initializer.
+
+        :param accuracy: Relative accuracy of quantiles. By default: 0.01.
+        :type accuracy: float
+        :param max_bins: Maximum number of bins kept. By default: 2048.
+        :type max_bins: int
+        :raise ValueError: If accuracy is not between 0 and 1 or max_bins is not positive
+        """
+
+        if not 0 < accuracy < 1:
+            raise ValueError('Accuracy should be between 0 and 1!')
+        if max_bins <= 0:
+            raise ValueError('Maximum number of bins should be positive!')
+
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = log(self._gamma)
+        self._max_bins = max_bins
+        self._bins = {}
+        self._keys = []  # keys of bins in ascending order
+        self._zeros = 0
+        self._count = 0
+
+    @property
+    def count(self):
+        return self._count
+
+    def add(self, value):
+        """
+        Count value.
+
+        :param value: Value to be counted
+        :type value: float
+        :raise ValueError: If value is negative
+        :return: None
+        :rtype: None
+        """
+
+        self._count += 1
+        if value > 0:
+            key = ceil(log(value) / self._log_gamma)
+            bins = self._bins
+            if key in bins:
+                bins[key] += 1
+            else:
+                bins[key] = 1
+                insort(self._keys, key)
+                if len(bins) > self._max_bins:
+                    self._collapse()
+        elif value == 0:
+            self._zeros += 1
+        else:
+            self._count -= 1
+            raise ValueError('Negative value!')
+
+    def _collapse(self):
+        """
+        Fold lowest bins into the lowest bin which is kept, so there are max_bins bins left.
+
+        :return: None
+        :rtype: None
+        """
+
+        bins, keys = self._bins, self._keys
+        excess = len(keys) - self._max_bins
+        folded = sum(bins.pop(key) for key in keys[:excess])
+        del keys[:excess]
+        bins[keys[0]] += folded
+
+    def merge(self, other):
+        """
+        Count all values counted by other sketch with the same accuracy.
+
+        :param other: Sketch to be merged
+        :type other: QuantileSketch
+        :raise ValueError: If sketches have different accuracy
+        :return: None
+        :rtype: None
+        """
+
+        if other._gamma != self._gamma:
+            raise ValueError('Sketches have different accuracy!')
+
+        bins = self._bins
+        for key, count in other._bins.items():
+            bins[key] = bins.get(key, 0) + count
+        self._keys = sorted(bins)
+        self._zeros += other._zeros
+        self._count += other._count
+        if len(bins) > self._max_bins:
+            self._collapse()
+
+    def quantile(self, q):
+        """
+        Get approximate quantile of counted values.
+
+        :param q: Quantile level
+        :type q: float
+        :raise ValueError: If q is not between 0 and 1 or there are no values
+        :return: approximate quantile
+        :rtype: float
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError('Quantile level should be between 0 and 1!')
+        if not self._count:
+            raise ValueError('Empty sketch!')
+
+        rank = q * (self._count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for key in self._keys:
+            seen += self._bins[key]
+            if rank < seen:
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** self._keys[-1] / (self._gamma + 1)
+
+    def __len__(self):
+        return len(self._bins)
+
+
+class _Metric:
+    """
+    Count, total and quantile sketch of one metric of one model within one time bucket.
+    """
+
+    __slots__ = ('count', 'total', 'sketch')
+
+    def __init__(self, accuracy):
+        self.count = 0
+        self.total = 0.0
+        self.sketch = QuantileSketch(accuracy)
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.sketch.add(value)
+
+
+class FuelEconomyStream:
+    """
+    Collect per-model statistics of fuel used, distance driven and fuel refilled over sliding time window.
+
+    Stream subscribes to state changes of added cars. Window is split into buckets; statistics of bucket
+    which leaves window are dropped, so memory depends on number of buckets and models, not on number of events.
+
+    Metrics:
+    :fuel_used: fuel used by one drive
+    :distance: distance of one drive
+    :refill: fuel added by one refill
+
+    Usage:
+    :>>> stream = FuelEconomyStream(window=60.0)
+    :>>> car = Car(100.0, 0.5, Point(0.0, 0.0), 'BMW')
+    :>>> stream.add(car)
+    :>>> car.refill(50)
+    :>>> car.drive(3.0, 4.0)
+    :>>> summary = stream.snapshot()['BMW']
+    :>>> print(summary['distance'].total, summary['fuel_used'].total, summary['refill'].count)
+    5.0 2.5 1
+    """
+
+    _metrics = ('fuel_used', 'distance', 'refill')
+
+    def __init__(self, cars=(), window=60.0, buckets=12, accuracy=0.01, clock=monotonic):
+        """
+        The initializer.
+
+        :param cars: Cars to be observed
+        :type cars: Iterable of Car
+        :param window: Length of sliding window in seconds. By default: 60.0.
+        :type window: float
+        :param buckets: Number of buckets window is split into. By default: 12.
+        :type buckets: int
+        :param accuracy: Relative accuracy of quantiles. By default: 0.01.
+        :type accuracy: float
+        :param clock: Function returning current time in seconds. By default: time.monotonic.
+        :type clock: callable
+        :raise ValueError: If window or buckets is not positive
+        :raise TypeError: If car is not of Car type
+        """
+
+        if window <= 0:
+            raise ValueError('Window should be positive!')
+        if buckets <= 0:
+            raise ValueError('Number of buckets should be positive!')
+
+        self._width = window / buckets
+        self._buckets = deque(maxlen=buckets)
+        self._accuracy = accuracy
+        self._clock = clock
+        self._cars = {}
+
+        for car in cars:
+            self.add(car)
+
+    @staticmethod
+    def _validate_car(car):
+        """
+        Validate if car is of Car type.
+
+        :param car: Object to validate
+        :type car: Car
+        :raise TypeError: If car is not of Car type
+        :return: car if Car type
+        :rtype: Car
+        """
+
+        if isinstance(car, Car):
+            return car
+        else:
+            raise TypeError(f'Incorrect field type: {type(car)} instead of {Car}')
+
+    def add(self, car):
+        """
+        Start observing car.
+
+        :param car: Car to be observed
+        :type car: Car
+        :raise TypeError: If car is not of Car type
+        :raise ValueError: If car is already observed
+        :return: None
+        :rtype: None
+        """
+
+        car = self._validate_car(car)
+        if id(car) in self._cars:
+            raise ValueError(f'{car!r} is already observed')
+
+        self._cars[id(car)] = car
+        car.subscribe(self._on_change)
+
+    def remove(self, car):
+        """
+        Stop observing car. Statistics already collected for it are kept.
+
+        :param car: Observed car
+        :type car: Car
+        :raise KeyError: If car is not observed
+        :return: None
+        :rtype: None
+        """
+
+        del self._cars[id(car)]
+        car.unsubscribe(self._on_change)
+
+    def _current_metrics(self, model):
+        """
+        Get metrics of model in current bucket, starting new bucket when time moved to next one.
+
+        :param model: Model of car
+        :type model: str
+        :return: metric name -> _Metric
+        :rtype: dict
+        """
+
+        number = int(self._clock() // self._width)
+        buckets = self._buckets
+        if not buckets or buckets[-1][0] != number:
+            buckets.append((number, {}))
+
+        bucket = buckets[-1][1]
+        metrics = bucket.get(model)
+        if metrics is None:
+            metrics = bucket[model] = {name: _Metric(self._accuracy) for name in self._metrics}
+        return metrics
+
+    def _on_change(self, car, attribute, old, new):
+        if attribute == 'location':
+            distance = old.distance(new)
+            metrics = self._current_metrics(car.model)
+            metrics['distance'].add(distance)
+            metrics['fuel_used'].add(distance * car.fuel_consumption)
+        elif attribute == 'fuel_amount' and new > old:
+            self._current_metrics(car.model)['refill'].add(new - old)
+
+    def snapshot(self, quantiles=(0.5, 0.9, 0.99)):
+        """
+        Summarise statistics within current window.
+
+        :param quantiles: Quantile levels to be estimated. By default: (0.5, 0.9, 0.99).
+        :type quantiles: Iterable of float
+        :return: model -> metric -> summary; quantiles of metric without values are None
+        :rtype: dict
+        """
+
+        oldest = int(self._clock() // self._width) - self._buckets.maxlen
+        merged = {}
+        for number, bucket in self._buckets:
+            if number <= oldest:
+                continue
+            for model, metrics in bucket.items():
+                merged_metrics = merged.get(model)
+                if merged_metrics is None:
+                    merged_metrics = merged[model] = {name: _Metric(self._accuracy) for name in self._metrics}
+                for name, metric in metrics.items():
+                    merged_metric = merged_metrics[name]
+                    merged_metric.count += metric.count
+                    merged_metric.total += metric.total
+                    merged_metric.sketch.merge(metric.sketch)
+
+        return {
+            model: {
+                name: MetricSummary(
+                    metric.count,
+                    metric.total,
+                    metric.total / metric.count if metric.count else 0.0,
+                    {q: metric.sketch.quantile(q) if metric.count else None for q in quantiles},
+                )
+                for name, metric in metrics.items()
+            }
+            for model, metrics in merged.items()
+        }
+
+    def __len__(self):
+        return len(self._cars)
+
+    def __repr__(self):
+        return f'FuelEconomyStream: {len(self)} cars, window {self._width * self._buckets.maxlen}'
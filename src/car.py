@@ -5,11 +5,13 @@ __all__ = (
     'Car',
 )
 
+from copyreg import __newobj__
+from src.observable import Observable
 from src.point import Point
 from math import fabs
 
 
-class Car:
+class Car(Observable):
     """
     Create car and provide refill and drive capabilities
 
@@ -154,7 +156,9 @@ class Car:
         if self._fuel_capacity - self._fuel_amount < fuel:
             raise Warning('Too much fuel! Refill was not started!')
         else:
+            old_fuel_amount = self._fuel_amount
             self._fuel_amount += fuel
+            self._notify('fuel_amount', old_fuel_amount, self._fuel_amount)
 
     def _drive(self, destination):
         """
@@ -176,8 +180,14 @@ class Car:
         if self._fuel_amount < fuel_needed:
             raise Warning('Not enough fuel! Drive was not started!')
         else:
+            old_fuel_amount, old_location = self._fuel_amount, self._location
+            if self._observers:
+                # SharedCar moves its location in place, so observers get a copy of old one
+                old_location = Point(old_location.x, old_location.y)
             self._fuel_amount -= fuel_needed
             self._location = destination
+            self._notify('fuel_amount', old_fuel_amount, self._fuel_amount)
+            self._notify('location', old_location, destination)
 
     def drive(self, *args):
         """
@@ -215,3 +225,18 @@ class Car:
                         f'located at {self.location}')
 
         return presentation
+
+    def __getstate__(self):
+        location = self._location
+        return (
+            self._fuel_capacity, self._fuel_consumption, self._fuel_amount,
+            location.x, location.y, self._model
+        )
+
+    def __setstate__(self, state):
+        self._fuel_capacity, self._fuel_consumption, self._fuel_amount, x, y, self._model = state
+        self._location = Point.__new__(Point)
+        self._location.__setstate__((x, y))
+
+    def __reduce__(self):
+        return __newobj__, (type(self),), self.__getstate__()
@@ -0,0 +1,174 @@
+"""Define compact binary codec for sequences of points, cars and units"""
+
+__author__ = 'santa'
+__all__ = (
+    'pack_many',
+    'unpack_many',
+)
+
+from struct import Struct, error as StructError
+from src.car import Car
+from src.point import Point
+from src.unit import CompactUnit, Unit
+
+_MAGIC = b'SNT2'
+# magic, kind of objects, number of objects, number of strings, size of string table in bytes
+_HEADER = Struct('<4sBIII')
+_STRING_LENGTH = Struct('<I')
+
+# kind: (class, record layout, index of string field in state or None)
+_KINDS = {
+    0: (Point, Struct('<dd'), None),
+    1: (Car, Struct('<dddddI'), 5),
+    2: (Unit, Struct('<Iddd'), 0),
+    3: (CompactUnit, Struct('<Iddd'), 0),
+}
+_CODES = {cls: code for code, (cls, _, _) in _KINDS.items()}
+
+
+def _validate_kind(objects):
+    """
+    Validate if all objects are of the same supported type.
+
+    :param objects: Objects to validate
+    :type objects: list
+    :raise TypeError: If objects are of different or not supported types
+    :return: code of kind of objects
+    :rtype: int
+    """
+
+    if not objects:
+        return 0
+
+    cls = type(objects[0])
+    code = _CODES.get(cls)
+    if code is None or any(type(obj) is not cls for obj in objects):
+        raise TypeError(f'Incorrect field type: objects should be all of one of {tuple(_CODES)}')
+    return code
+
+
+def _pack_strings(strings):
+    """
+    Pack strings into table: every string is utf-8 bytes prefixed with their length.
+
+    :param strings: Strings to be packed
+    :type strings: Iterable of str
+    :return: packed table
+    :rtype: bytes
+    """
+
+    parts = []
+    for string in strings:
+        encoded = string.encode()
+        parts.append(_STRING_LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    return b''.join(parts)
+
+
+def _unpack_strings(table, count):
+    """
+    Unpack count strings from table packed by _pack_strings.
+
+    :param table: Packed table
+    :type table: bytes
+    :param count: Number of strings
+    :type count: int
+    :raise ValueError: If table is corrupt
+    :return: strings
+    :rtype: list of str
+    """
+
+    strings = []
+    offset = 0
+    for _ in range(count):
+        try:
+            length, = _STRING_LENGTH.unpack_from(table, offset)
+        except StructError:
+            raise ValueError('String table is truncated!') from None
+        offset += _STRING_LENGTH.size
+        if offset + length > len(table):
+            raise ValueError('String table is truncated!')
+        strings.append(table[offset:offset + length].decode())
+        offset += length
+    if offset != len(table):
+        raise ValueError('String table is corrupt!')
+    return strings
+
+
+def pack_many(objects):
+    """
+    Pack objects of one type into bytes using fixed record layout. Strings are stored once in string table.
+
+    Layout: header, string table (every string is its utf-8 length and bytes), records.
+
+    :param objects: Objects to be packed
+    :type objects: Sequence of Point, Car, Unit or CompactUnit
+    :raise TypeError: If objects are of different or not supported types
+    :return: packed objects
+    :rtype: bytes
+    """
+
+    objects = list(objects)
+    code = _validate_kind(objects)
+    _, record, string_field = _KINDS[code]
+
+    states = [obj.__getstate__() for obj in objects]
+    strings = {}
+    if string_field is not None:
+        for state in states:
+            strings.setdefault(state[string_field], len(strings))
+        states = [
+            state[:string_field] + (strings[state[string_field]],) + state[string_field + 1:]
+            for state in states
+        ]
+
+    table = _pack_strings(strings)
+    pack = record.pack
+    return b''.join((
+        _HEADER.pack(_MAGIC, code, len(states), len(strings), len(table)),
+        table,
+        b''.join([pack(*state) for state in states]),
+    ))
+
+
+def unpack_many(data):
+    """
+    Unpack objects packed by pack_many. Objects are restored from their state without validation.
+
+    :param data: Packed objects
+    :type data: bytes-like object
+    :raise ValueError: If data is not packed by pack_many or is truncated
+    :return: unpacked objects
+    :rtype: list of Point, Car, Unit or CompactUnit
+    """
+
+    data = memoryview(data)
+    try:
+        magic, code, count, string_count, table_size = _HEADER.unpack_from(data)
+    except StructError:
+        raise ValueError('Data is truncated!') from None
+    if magic != _MAGIC or code not in _KINDS:
+        raise ValueError('Data is not packed by pack_many!')
+
+    cls, record, string_field = _KINDS[code]
+    start = _HEADER.size + table_size
+    end = start + count * record.size
+    if len(data) != end:
+        raise ValueError('Data is truncated!')
+
+    strings = _unpack_strings(bytes(data[_HEADER.size:start]), string_count)
+
+    new = cls.__new__
+    objects = []
+    append = objects.append
+    for state in record.iter_unpack(data[start:end]):
+        if string_field is not None:
+            try:
+                string = strings[state[string_field]]
+            except IndexError:
+                raise ValueError('String index is out of range!') from None
+            state = state[:string_field] + (string,) + state[string_field + 1:]
+        obj = new(cls)
+        obj.__setstate__(state)
+        append(obj)
+    return objects
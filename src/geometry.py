@@ -0,0 +1,293 @@
+"""Define PointArray, BoundingBox classes and geometry aggregates over points"""
+
+__author__ = 'santa'
+__all__ = (
+    'PointArray',
+    'BoundingBox',
+    'bounding_box',
+    'centroid',
+    'convex_hull',
+)
+
+from array import array
+from math import fsum
+from src.point import Point
+
+
+class PointArray:
+    """
+    Columnar storage of two-dimensional points: x and y coordinates are kept in two flat arrays of doubles.
+
+    Usage:
+    :>>> points = PointArray.from_points([Point(1.0, 2.0), Point(3.0, 4.0)])
+    :>>> print(len(points))
+    2
+    :>>> print(points[1])
+    (3.0, 4.0)
+    :>>> points.append(Point(5.0, 6.0))
+    :>>> print(list(points.xs))
+    [1.0, 3.0, 5.0]
+    """
+
+    def __init__(self, xs=(), ys=()):
+        """
+        The initializer.
+
+        :param xs: x-coordinates of points
+        :type xs: Iterable of values that can be converted to float
+        :param ys: y-coordinates of points
+        :type ys: Iterable of values that can be converted to float
+        :raise ValueError: If xs and ys have different length
+        """
+
+        self._xs = array('d', xs)
+        self._ys = array('d', ys)
+        if len(self._xs) != len(self._ys):
+            raise ValueError('Columns of coordinates have different length!')
+
+    @classmethod
+    def from_points(cls, points):
+        """
+        Create columnar array from sequence of points.
+
+        :param points: Points to be stored
+        :type points: Iterable of Point
+        :return: new array with coordinates of points
+        :rtype: PointArray
+        """
+
+        points = list(points)
+        return cls((point.x for point in points), (point.y for point in points))
+
+    @property
+    def xs(self):
+        return self._xs
+
+    @property
+    def ys(self):
+        return self._ys
+
+    def append(self, point):
+        """
+        Append point to the end of array.
+
+        :param point: Point to be appended
+        :type point: Point
+        :return: None
+        :rtype: None
+        """
+
+        self._xs.append(point.x)
+        self._ys.append(point.y)
+
+    def __len__(self):
+        return len(self._xs)
+
+    def __getitem__(self, index):
+        return Point(self._xs[index], self._ys[index])
+
+    def __iter__(self):
+        return map(Point, self._xs, self._ys)
+
+    def __repr__(self):
+        return f'PointArray of {len(self)} points'
+
+
+def _columns(points):
+    """
+    Get x and y columns of points.
+
+    :param points: Points to be split into columns
+    :type points: PointArray or iterable of Point
+    :raise ValueError: If there are no points
+    :return: x-coordinates and y-coordinates
+    :rtype: tuple
+    """
+
+    if isinstance(points, PointArray):
+        xs, ys = points.xs, points.ys
+    else:
+        points = list(points)
+        xs = [point.x for point in points]
+        ys = [point.y for point in points]
+
+    if not xs:
+        raise ValueError('Empty collection of points!')
+    return xs, ys
+
+
+def bounding_box(points):
+    """
+    Calculate axis-aligned bounding box of points.
+
+    :param points: Points to be bounded
+    :type points: PointArray or iterable of Point
+    :raise ValueError: If there are no points
+    :return: lower-left and upper-right corners of box
+    :rtype: tuple of Point
+    """
+
+    xs, ys = _columns(points)
+    return Point(min(xs), min(ys)), Point(max(xs), max(ys))
+
+
+def centroid(points):
+    """
+    Calculate centroid (mean position) of points.
+
+    :param points: Points to be averaged
+    :type points: PointArray or iterable of Point
+    :raise ValueError: If there are no points
+    :return: centroid of points
+    :rtype: Point
+    """
+
+    xs, ys = _columns(points)
+    return Point(fsum(xs) / len(xs), fsum(ys) / len(ys))
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def convex_hull(points):
+    """
+    Calculate convex hull of points by monotone chain algorithm in O(n log n).
+
+    :param points: Points to be enclosed
+    :type points: PointArray or iterable of Point
+    :raise ValueError: If there are no points
+    :return: vertices of hull in counter-clockwise order starting from the lowest-leftmost one,
+             collinear points on edges are dropped
+    :rtype: list of Point
+    """
+
+    xs, ys = _columns(points)
+    coordinates = sorted(set(zip(xs, ys)))
+    if len(coordinates) < 3:
+        return [Point(x, y) for x, y in coordinates]
+
+    lower = []
+    for coordinate in coordinates:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], coordinate) <= 0:
+            lower.pop()
+        lower.append(coordinate)
+
+    upper = []
+    for coordinate in reversed(coordinates):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], coordinate) <= 0:
+            upper.pop()
+        upper.append(coordinate)
+
+    return [Point(x, y) for x, y in lower[:-1] + upper[:-1]]
+
+
+class BoundingBox:
+    """
+    Incrementally maintained bounding box of keyed points which can move or be removed.
+
+    Growing the box is O(1) per update. When a point lying on the border moves inward or is
+    removed, the box is recalculated lazily on the next read.
+
+    Usage:
+    :>>> box = BoundingBox()
+    :>>> box.update('bmw', Point(1.0, 1.0))
+    :>>> box.update('taz', Point(5.0, 3.0))
+    :>>> print(box.lower, box.upper)
+    (1.0, 1.0) (5.0, 3.0)
+    :>>> box.update('taz', Point(2.0, 2.0))
+    :>>> print(box.lower, box.upper)
+    (1.0, 1.0) (2.0, 2.0)
+    """
+
+    def __init__(self):
+        """
+        The initializer.
+
+        :box: Initially box is empty
+        """
+
+        self._points = {}
+        self._bounds = None
+        self._dirty = False
+
+    def _on_border(self, x, y):
+        min_x, min_y, max_x, max_y = self._bounds
+        return x == min_x or x == max_x or y == min_y or y == max_y
+
+    def update(self, key, point):
+        """
+        Add point or move point already tracked under key.
+
+        :param key: Identifier of point, e.g. car
+        :type key: Any hashable
+        :param point: New position of point
+        :type point: Point
+        :return: None
+        :rtype: None
+        """
+
+        x, y = point.x, point.y
+        previous = self._points.get(key)
+        self._points[key] = (x, y)
+
+        if self._dirty:
+            return
+        if self._bounds is None:
+            self._bounds = (x, y, x, y)
+            return
+        if previous is not None and self._on_border(*previous):
+            self._dirty = True
+            return
+
+        min_x, min_y, max_x, max_y = self._bounds
+        self._bounds = (min(min_x, x), min(min_y, y), max(max_x, x), max(max_y, y))
+
+    def remove(self, key):
+        """
+        Stop tracking point.
+
+        :param key: Identifier of point
+        :type key: Any hashable
+        :raise KeyError: If point is not tracked
+        :return: None
+        :rtype: None
+        """
+
+        x, y = self._points.pop(key)
+        if not self._dirty and self._on_border(x, y):
+            self._dirty = True
+
+    def _recalculate(self):
+        if self._points:
+            xs = [x for x, _ in self._points.values()]
+            ys = [y for _, y in self._points.values()]
+            self._bounds = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            self._bounds = None
+        self._dirty = False
+
+    def _get_bounds(self):
+        if self._dirty:
+            self._recalculate()
+        if self._bounds is None:
+            raise ValueError('Empty collection of points!')
+        return self._bounds
+
+    @property
+    def lower(self):
+        min_x, min_y, _, _ = self._get_bounds()
+        return Point(min_x, min_y)
+
+    @property
+    def upper(self):
+        _, _, max_x, max_y = self._get_bounds()
+        return Point(max_x, max_y)
+
+    def __len__(self):
+        return len(self._points)
+
+    def __repr__(self):
+        if not self._points:
+            return 'BoundingBox: empty'
+        return f'BoundingBox: {self.lower} - {self.upper}'
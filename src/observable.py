@@ -0,0 +1,66 @@
+"""Define Observable mixin"""
+
+__author__ = 'santa'
+__all__ = (
+    'Observable',
+)
+
+
+class Observable:
+    """
+    Provide subscription to state changes of object.
+
+    Observer is callable which receives object, name of changed attribute, old and new value.
+
+    Usage:
+    :>>> car = Car()
+    :>>> car.subscribe(print)
+    :>>> car.refill(10)
+    Car: Mercedes (consumption 0.6), fuel 10.0 (60.0), located at (0.0, 0.0) fuel_amount 0.0 10.0
+    """
+
+    __slots__ = ()
+
+    _observers = ()
+
+    def subscribe(self, observer):
+        """
+        Add observer of state changes.
+
+        :param observer: Callable receiving object, attribute, old value and new value
+        :type observer: callable
+        :return: None
+        :rtype: None
+        """
+
+        self._observers = self._observers + (observer,)
+
+    def unsubscribe(self, observer):
+        """
+        Remove observer of state changes.
+
+        :param observer: Observer added by subscribe
+        :type observer: callable
+        :raise ValueError: If observer is not subscribed
+        :return: None
+        :rtype: None
+        """
+
+        observers = list(self._observers)
+        observers.remove(observer)
+        self._observers = tuple(observers)
+
+    def _notify(self, attribute, old, new):
+        """
+        Call all observers.
+
+        :param attribute: Name of changed attribute
+        :type attribute: str
+        :param old: Value before change
+        :param new: Value after change
+        :return: None
+        :rtype: None
+        """
+
+        for observer in self._observers:
+            observer(self, attribute, old, new)
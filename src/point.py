@@ -5,6 +5,7 @@ __all__ = (
     'Point',
 )
 
+from copyreg import __newobj__
 from math import hypot
 
 
@@ -105,3 +106,12 @@ class Point:
 
     def __ne__(self, other):
         return self._x != other._x or self._y != other._y
+
+    def __getstate__(self):
+        return self._x, self._y
+
+    def __setstate__(self, state):
+        self._x, self._y = state
+
+    def __reduce__(self):
+        return __newobj__, (type(self),), self.__getstate__()
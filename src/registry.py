@@ -0,0 +1,310 @@
+"""Define Fleet and Army registries with incrementally maintained aggregates and AggregateMismatch exception"""
+
+__author__ = 'santa'
+__all__ = (
+    'Fleet',
+    'Army',
+    'AggregateMismatch',
+)
+
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from math import fsum, isclose
+from types import MappingProxyType
+from src.car import Car
+from src.unit import Unit
+
+
+class AggregateMismatch(Exception):
+    pass
+
+
+class _Registry(ABC):
+    """
+    Collection of objects which subscribes to their state changes.
+
+    Subclasses maintain aggregates in _include, _exclude and _on_change and define _aggregates,
+    which returns aggregates recomputed from scratch.
+    """
+
+    _type = object
+
+    def __init__(self, objects=(), verify=False):
+        """
+        The initializer.
+
+        :param objects: Objects to be registered
+        :type objects: Iterable
+        :param verify: If every read of aggregate should be cross-checked against full recompute. By default: False.
+        :type verify: bool
+        :raise TypeError: If object is not of registry type
+        """
+
+        self._objects = {}
+        self._verify = verify
+        for obj in objects:
+            self.add(obj)
+
+    def _validate_type(self, obj):
+        """
+        Validate if obj is of registry type.
+
+        :param obj: Object to validate
+        :raise TypeError: If obj is not of registry type
+        :return: obj if of registry type
+        """
+
+        if isinstance(obj, self._type):
+            return obj
+        else:
+            raise TypeError(f'Incorrect field type: {type(obj)} instead of {self._type}')
+
+    def add(self, obj):
+        """
+        Register object and include it into aggregates.
+
+        :param obj: Object to be registered
+        :raise TypeError: If obj is not of registry type
+        :raise ValueError: If obj is already registered
+        :return: None
+        :rtype: None
+        """
+
+        obj = self._validate_type(obj)
+        if id(obj) in self._objects:
+            raise ValueError(f'{obj!r} is already registered')
+
+        self._objects[id(obj)] = obj
+        self._include(obj)
+        obj.subscribe(self._on_change)
+
+    def remove(self, obj):
+        """
+        Unregister object and exclude it from aggregates.
+
+        :param obj: Object to be unregistered
+        :raise KeyError: If obj is not registered
+        :return: None
+        :rtype: None
+        """
+
+        del self._objects[id(obj)]
+        obj.unsubscribe(self._on_change)
+        self._exclude(obj)
+
+    @abstractmethod
+    def _include(self, obj):
+        """
+        Add obj to aggregates.
+
+        :param obj: Registered object
+        :return: None
+        :rtype: None
+        """
+
+    @abstractmethod
+    def _exclude(self, obj):
+        """
+        Remove obj from aggregates.
+
+        :param obj: Unregistered object
+        :return: None
+        :rtype: None
+        """
+
+    @abstractmethod
+    def _on_change(self, obj, attribute, old, new):
+        """
+        Update aggregates after state change of registered object.
+
+        :param obj: Changed object
+        :param attribute: Name of changed attribute
+        :type attribute: str
+        :param old: Value before change
+        :param new: Value after change
+        :return: None
+        :rtype: None
+        """
+
+    @abstractmethod
+    def _aggregates(self):
+        """
+        Recompute all aggregates from scratch.
+
+        :return: name of aggregate -> value
+        :rtype: dict
+        """
+
+    def _read(self, name, value):
+        """
+        Return aggregate, cross-checking it against full recompute in verification mode.
+
+        :param name: Name of aggregate
+        :type name: str
+        :param value: Incrementally maintained value
+        :raise AggregateMismatch: If value differs from recomputed one
+        :return: value
+        """
+
+        if self._verify:
+            expected = self._aggregates()[name]
+            if isinstance(expected, dict):
+                keys = set(expected) | {key for key, total in value.items() if total}
+                matches = all(isclose(value.get(key, 0.0), expected.get(key, 0.0), abs_tol=1e-6) for key in keys)
+            else:
+                matches = isclose(value, expected, abs_tol=1e-6)
+            if not matches:
+                raise AggregateMismatch(f'{name}: {value} instead of {expected}')
+        return value
+
+    def verify(self):
+        """
+        Cross-check all aggregates against full recompute.
+
+        :raise AggregateMismatch: If any aggregate differs from recomputed one
+        :return: None
+        :rtype: None
+        """
+
+        verify, self._verify = self._verify, True
+        try:
+            for name in self._aggregates():
+                self._read(name, getattr(self, name))
+        finally:
+            self._verify = verify
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __iter__(self):
+        return iter(self._objects.values())
+
+    def __contains__(self, obj):
+        return id(obj) in self._objects
+
+
+class Fleet(_Registry):
+    """
+    Registry of cars with O(1) total fuel amount and fuel amount per model.
+
+    Usage:
+    :>>> fleet = Fleet([Car(model='BMW'), Car(model='Taz')])
+    :>>> for car in fleet:
+    :...     car.refill(20)
+    :>>> print(fleet.fuel_amount)
+    40.0
+    :>>> print(fleet.fuel_amount_by_model['BMW'])
+    20.0
+    :>>> fleet.verify()
+    """
+
+    _type = Car
+
+    def __init__(self, cars=(), verify=False):
+        """
+        The initializer.
+
+        :param cars: Cars to be registered
+        :type cars: Iterable of Car
+        :param verify: If every read of aggregate should be cross-checked against full recompute. By default: False.
+        :type verify: bool
+        :raise TypeError: If car is not of Car type
+        """
+
+        self._fuel_amount = 0.0
+        self._fuel_amount_by_model = {}
+        super().__init__(cars, verify)
+
+    def _add_fuel_amount(self, model, delta):
+        self._fuel_amount += delta
+        self._fuel_amount_by_model[model] = self._fuel_amount_by_model.get(model, 0.0) + delta
+
+    def _include(self, car):
+        self._add_fuel_amount(car.model, car.fuel_amount)
+
+    def _exclude(self, car):
+        self._add_fuel_amount(car.model, -car.fuel_amount)
+
+    def _on_change(self, car, attribute, old, new):
+        if attribute == 'fuel_amount':
+            self._add_fuel_amount(car.model, new - old)
+
+    def _aggregates(self):
+        fuel_amount_by_model = defaultdict(list)
+        for car in self:
+            fuel_amount_by_model[car.model].append(car.fuel_amount)
+
+        return {
+            'fuel_amount': fsum(car.fuel_amount for car in self),
+            'fuel_amount_by_model': {model: fsum(amounts) for model, amounts in fuel_amount_by_model.items()},
+        }
+
+    @property
+    def fuel_amount(self):
+        return self._read('fuel_amount', self._fuel_amount)
+
+    @property
+    def fuel_amount_by_model(self):
+        return self._read('fuel_amount_by_model', MappingProxyType(self._fuel_amount_by_model))
+
+
+class Army(_Registry):
+    """
+    Registry of units with O(1) total and mean hit points and number of living units.
+
+    Usage:
+    :>>> army = Army([Unit('Archer', 100), Unit('Knight', 300)])
+    :>>> print(army.hit_points, army.mean_hit_points, army.alive)
+    400.0 200.0 2
+    """
+
+    _type = Unit
+
+    def __init__(self, units=(), verify=False):
+        """
+        The initializer.
+
+        :param units: Units to be registered
+        :type units: Iterable of Unit
+        :param verify: If every read of aggregate should be cross-checked against full recompute. By default: False.
+        :type verify: bool
+        :raise TypeError: If unit is not of Unit type
+        """
+
+        self._hit_points = 0.0
+        self._alive = 0
+        super().__init__(units, verify)
+
+    def _include(self, unit):
+        self._hit_points += unit.hit_points
+        self._alive += unit.hit_points > 0
+
+    def _exclude(self, unit):
+        self._hit_points -= unit.hit_points
+        self._alive -= unit.hit_points > 0
+
+    def _on_change(self, unit, attribute, old, new):
+        if attribute == 'hit_points':
+            self._hit_points += new - old
+            self._alive += (new > 0) - (old > 0)
+
+    def _aggregates(self):
+        hit_points = fsum(unit.hit_points for unit in self)
+        return {
+            'hit_points': hit_points,
+            'mean_hit_points': hit_points / len(self) if self._objects else 0.0,
+            'alive': sum(unit.hit_points > 0 for unit in self),
+        }
+
+    @property
+    def hit_points(self):
+        return self._read('hit_points', self._hit_points)
+
+    @property
+    def mean_hit_points(self):
+        mean = self._hit_points / len(self) if self._objects else 0.0
+        return self._read('mean_hit_points', mean)
+
+    @property
+    def alive(self):
+        return self._read('alive', self._alive)
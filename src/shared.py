@@ -0,0 +1,458 @@
+"""Define shared-memory buffers of points and cars and proxy objects reading from them"""
+
+__author__ = 'santa'
+__all__ = (
+    'SharedPoints',
+    'SharedFleet',
+    'SharedPoint',
+    'SharedCar',
+)
+
+from contextlib import contextmanager
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from os import name as os_name
+from sys import version_info
+from time import monotonic, sleep
+from src.car import Car
+from src.codec import _pack_strings, _unpack_strings
+from src.point import Point
+
+_HEADER_SIZE = 4  # write sequence, number of rows, number of strings, size of string table in bytes
+_ITEM_SIZE = 8
+
+
+class _SharedColumns:
+    """
+    Fixed number of rows stored as columns of doubles in named shared memory block.
+
+    Layout of block: header of four int64 values, then columns one after another,
+    then string table with every string stored as its utf-8 length and bytes.
+
+    Only the process which created the block may write to it. Writer increments sequence
+    counter before and after every update, so sequence is odd while update is in progress.
+    Readers use it to get consistent rows without locking (seqlock).
+    """
+
+    _columns = ()
+
+    def __init__(self, shm, writer):
+        """
+        The initializer. Use create or attach instead.
+
+        :param shm: Shared memory block
+        :type shm: SharedMemory
+        :param writer: If this side is allowed to write
+        :type writer: bool
+        """
+
+        self._shm = shm
+        self._writer = writer
+        self._depth = 0
+
+        buffer = shm.buf if writer else shm.buf.toreadonly()
+        self._header = buffer[:_HEADER_SIZE * _ITEM_SIZE].cast('q')
+        rows = self._header[1]
+
+        start = _HEADER_SIZE * _ITEM_SIZE
+        end = start + len(self._columns) * rows * _ITEM_SIZE
+        self._data = buffer[start:end].cast('d')
+        self._views = {
+            column: self._data[number * rows:(number + 1) * rows]
+            for number, column in enumerate(self._columns)
+        }
+
+        self._strings = tuple(_unpack_strings(bytes(buffer[end:end + self._header[3]]), self._header[2]))
+        buffer.release()
+
+    @classmethod
+    def _create(cls, name, rows, strings=()):
+        """
+        Create shared memory block.
+
+        :param name: Name of block, used by other processes to attach
+        :type name: str or None
+        :param rows: Number of rows
+        :type rows: int
+        :param strings: Strings to be stored in string table
+        :type strings: Sequence of str
+        :raise FileExistsError: If block with such name already exists
+        :return: writer side of buffer
+        """
+
+        table = _pack_strings(strings)
+        size = (_HEADER_SIZE + len(cls._columns) * rows) * _ITEM_SIZE + len(table)
+        shm = SharedMemory(name=name, create=True, size=max(size, 1))
+
+        header = shm.buf[:_HEADER_SIZE * _ITEM_SIZE].cast('q')
+        header[0], header[1], header[2], header[3] = 0, rows, len(strings), len(table)
+        header.release()
+        shm.buf[size - len(table):size] = table
+
+        return cls(shm, writer=True)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attach to buffer created by other process. Attached side is read-only.
+        Block is not tracked by attaching process, so it exists until writer unlinks it.
+
+        :param name: Name of block
+        :type name: str
+        :raise FileNotFoundError: If there is no block with such name
+        :return: read-only side of buffer
+        """
+
+        if version_info >= (3, 13):
+            return cls(SharedMemory(name=name, track=False), writer=False)
+
+        shm = SharedMemory(name=name)
+        # Attaching registers block with resource tracker of this process, which would unlink it
+        # when this process exits. Block is owned by writer, so only writer's tracker should track it.
+        if os_name == 'posix':
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(shm, writer=False)
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def readonly(self):
+        return not self._writer
+
+    def column(self, column):
+        """
+        Get view of column.
+
+        :param column: Name of column
+        :type column: str
+        :raise KeyError: If there is no such column
+        :return: view of doubles, read-only on attached side
+        :rtype: memoryview
+        """
+
+        return self._views[column]
+
+    @contextmanager
+    def writing(self):
+        """
+        Mark block of updates, so readers do not see it partially applied. Can be nested.
+
+        :raise PermissionError: If buffer is attached read-only
+        """
+
+        if not self._writer:
+            raise PermissionError('Buffer is attached read-only!')
+
+        if self._depth == 0:
+            self._header[0] += 1
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._header[0] += 1
+
+    def read(self, index, timeout=None):
+        """
+        Read consistent row, retrying while writer is in the middle of update.
+        Writer side reads directly inside writing block.
+
+        :param index: Number of row
+        :type index: int
+        :param timeout: Seconds to wait for writer to finish update. By default: None, wait forever.
+        :type timeout: float or None
+        :raise IndexError: If there is no such row
+        :raise TimeoutError: If writer did not finish update in timeout
+        :return: values of all columns of row
+        :rtype: tuple of float
+        """
+
+        views = tuple(self._views.values())
+        if self._depth:
+            return tuple(view[index] for view in views)
+
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            sequence = self._header[0]
+            if not sequence % 2:
+                row = tuple(view[index] for view in views)
+                if self._header[0] == sequence:
+                    return row
+            if deadline is not None and monotonic() > deadline:
+                raise TimeoutError('Writer did not finish update!')
+            sleep(0)
+
+    def close(self):
+        """
+        Detach from block. Proxies created from buffer can not be used after it.
+
+        :return: None
+        :rtype: None
+        """
+
+        for view in self._views.values():
+            view.release()
+        self._data.release()
+        self._header.release()
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Destroy block. Should be called once by writer after all processes closed it.
+
+        :raise PermissionError: If buffer is attached read-only
+        :return: None
+        :rtype: None
+        """
+
+        if not self._writer:
+            raise PermissionError('Buffer is attached read-only!')
+        if os_name == 'posix':
+            # Reader sharing tracker with writer (same or child process) unregistered block on attach
+            resource_tracker.register(self._shm._name, 'shared_memory')
+        self._shm.unlink()
+
+    def __len__(self):
+        return self._header[1]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SharedPoint(Point):
+    """
+    Point which coordinates are stored in shared buffer.
+
+    Usage:
+    :>>> points = SharedPoints.create(None, [Point(1.0, 2.0)])
+    :>>> point = points[0]
+    :>>> point.x = 5.0
+    :>>> print(points.read(0))
+    (5.0, 2.0)
+    """
+
+    def __init__(self, buffer, index, x='x', y='y'):
+        """
+        The initializer.
+
+        :param buffer: Buffer where coordinates are stored
+        :type buffer: SharedPoints or SharedFleet
+        :param index: Number of row in buffer
+        :type index: int
+        :param x: Name of column with x-coordinate
+        :type x: str
+        :param y: Name of column with y-coordinate
+        :type y: str
+        """
+
+        self._buffer = buffer
+        self._index = index
+        self._xs = buffer.column(x)
+        self._ys = buffer.column(y)
+
+    @property
+    def _x(self):
+        return self._xs[self._index]
+
+    @_x.setter
+    def _x(self, value):
+        with self._buffer.writing():
+            self._xs[self._index] = value
+
+    @property
+    def _y(self):
+        return self._ys[self._index]
+
+    @_y.setter
+    def _y(self, value):
+        with self._buffer.writing():
+            self._ys[self._index] = value
+
+    def __reduce__(self):
+        return Point, (self._x, self._y)
+
+
+class SharedPoints(_SharedColumns):
+    """
+    Shared-memory buffer of point coordinates.
+
+    Usage:
+    :>>> points = SharedPoints.create('fleet_points', [Point(1.0, 2.0), Point(3.0, 4.0)])
+    :>>> reader = SharedPoints.attach('fleet_points')
+    :>>> print(reader[1])
+    (3.0, 4.0)
+    :>>> points[1] = Point(5.0, 6.0)
+    :>>> print(reader[1])
+    (5.0, 6.0)
+    :>>> reader.close()
+    :>>> points.close()
+    :>>> points.unlink()
+    """
+
+    _columns = ('x', 'y')
+
+    @classmethod
+    def create(cls, name, points):
+        """
+        Create buffer and fill it with coordinates of points.
+
+        :param name: Name of block, None to generate it
+        :type name: str or None
+        :param points: Points to be stored
+        :type points: Sequence of Point
+        :raise FileExistsError: If block with such name already exists
+        :return: writer side of buffer
+        :rtype: SharedPoints
+        """
+
+        points = list(points)
+        buffer = cls._create(name, len(points))
+        for index, point in enumerate(points):
+            buffer._views['x'][index] = point.x
+            buffer._views['y'][index] = point.y
+        return buffer
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError('Point index out of range')
+        return SharedPoint(self, index % len(self))
+
+    def __setitem__(self, index, point):
+        with self.writing():
+            self._views['x'][index] = point.x
+            self._views['y'][index] = point.y
+
+    def __repr__(self):
+        return f'SharedPoints {self.name}: {len(self)} points'
+
+
+class SharedCar(Car):
+    """
+    Car which state is stored in shared buffer. Refill and drive write to buffer.
+
+    Usage:
+    :>>> fleet = SharedFleet.create(None, [Car(100.0, 0.9, Point(1.0, 1.0), 'BMW')])
+    :>>> car = fleet[0]
+    :>>> car.refill(80)
+    :>>> car.drive(5.0, 5.0)
+    :>>> print(fleet.read(0)[3:5])
+    (5.0, 5.0)
+    """
+
+    def __init__(self, buffer, index):
+        """
+        The initializer.
+
+        :param buffer: Buffer where state is stored
+        :type buffer: SharedFleet
+        :param index: Number of row in buffer
+        :type index: int
+        """
+
+        self._buffer = buffer
+        self._index = index
+        self._views = {column: buffer.column(column) for column in buffer._columns}
+
+    @property
+    def _fuel_capacity(self):
+        return self._views['fuel_capacity'][self._index]
+
+    @property
+    def _fuel_consumption(self):
+        return self._views['fuel_consumption'][self._index]
+
+    @property
+    def _fuel_amount(self):
+        return self._views['fuel_amount'][self._index]
+
+    @_fuel_amount.setter
+    def _fuel_amount(self, value):
+        with self._buffer.writing():
+            self._views['fuel_amount'][self._index] = value
+
+    @property
+    def _location(self):
+        return SharedPoint(self._buffer, self._index)
+
+    @_location.setter
+    def _location(self, point):
+        with self._buffer.writing():
+            self._views['x'][self._index] = point.x
+            self._views['y'][self._index] = point.y
+
+    @property
+    def _model(self):
+        return self._buffer.models[int(self._views['model'][self._index])]
+
+    def _drive(self, destination):
+        with self._buffer.writing():
+            super()._drive(destination)
+
+    def __reduce__(self):
+        return Car, (), self.__getstate__()
+
+
+class SharedFleet(_SharedColumns):
+    """
+    Shared-memory buffer of car state columns. Models are kept in string table.
+
+    Usage:
+    :>>> fleet = SharedFleet.create('fleet', [Car(), Car(50, 0.9, Point(10.0, 10.0), 'Taz')])
+    :>>> reader = SharedFleet.attach('fleet')
+    :>>> fleet[1].refill(20)
+    :>>> print(reader[1].fuel_amount)
+    20.0
+    :>>> print(reader[1].model)
+    Taz
+    :>>> reader[1].refill(20)
+    PermissionError: Buffer is attached read-only!
+    """
+
+    _columns = ('fuel_capacity', 'fuel_consumption', 'fuel_amount', 'x', 'y', 'model')
+
+    @classmethod
+    def create(cls, name, cars):
+        """
+        Create buffer and fill it with state of cars.
+
+        :param name: Name of block, None to generate it
+        :type name: str or None
+        :param cars: Cars to be stored
+        :type cars: Sequence of Car
+        :raise FileExistsError: If block with such name already exists
+        :return: writer side of buffer
+        :rtype: SharedFleet
+        """
+
+        cars = list(cars)
+        models = sorted({car.model for car in cars})
+        codes = {model: code for code, model in enumerate(models)}
+
+        buffer = cls._create(name, len(cars), models)
+        views = buffer._views
+        for index, car in enumerate(cars):
+            views['fuel_capacity'][index] = car.fuel_capacity
+            views['fuel_consumption'][index] = car.fuel_consumption
+            views['fuel_amount'][index] = car.fuel_amount
+            views['x'][index] = car.location.x
+            views['y'][index] = car.location.y
+            views['model'][index] = codes[car.model]
+        return buffer
+
+    @property
+    def models(self):
+        return self._strings
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError('Car index out of range')
+        return SharedCar(self, index % len(self))
+
+    def __repr__(self):
+        return f'SharedFleet {self.name}: {len(self)} cars'
@@ -0,0 +1,239 @@
+"""Define SnapshotStore and Snapshot classes for copy-on-write snapshots of cars and units state"""
+
+__author__ = 'santa'
+__all__ = (
+    'CarState',
+    'UnitState',
+    'Snapshot',
+    'SnapshotStore',
+)
+
+from collections import namedtuple
+from threading import Lock
+from src.car import Car
+from src.unit import Unit
+
+CarState = namedtuple('CarState', ('fuel_amount', 'x', 'y'))
+UnitState = namedtuple('UnitState', ('hit_points',))
+
+
+def _state(obj):
+    """
+    Get current state of object.
+
+    :param obj: Object which state should be taken
+    :type obj: Car or Unit
+    :raise TypeError: If obj is not of Car or Unit type
+    :return: state of object
+    :rtype: CarState or UnitState
+    """
+
+    if isinstance(obj, Car):
+        location = obj.location
+        return CarState(obj.fuel_amount, location.x, location.y)
+    elif isinstance(obj, Unit):
+        return UnitState(obj.hit_points)
+    else:
+        raise TypeError(f'Incorrect field type: {type(obj)} instead of {Car} or {Unit}')
+
+
+class Snapshot:
+    """
+    Immutable view of state of objects at the moment snapshot was taken.
+
+    Usage:
+    :>>> print(snapshot[car])
+    CarState(fuel_amount=80.0, x=1.0, y=1.0)
+    :>>> print(snapshot[unit].hit_points)
+    200.0
+    """
+
+    def __init__(self, version, pages, page_size, indexes, length):
+        """
+        The initializer. Use SnapshotStore.snapshot instead.
+
+        :param version: Version of store snapshot was taken from
+        :type version: int
+        :param pages: Pages of states, never modified after snapshot was taken
+        :type pages: list of list
+        :param page_size: Number of states in one page
+        :type page_size: int
+        :param indexes: Mapping from id of object to its index in store, only grows
+        :type indexes: dict
+        :param length: Number of objects at the moment snapshot was taken
+        :type length: int
+        """
+
+        self._version = version
+        self._pages = pages
+        self._page_size = page_size
+        self._indexes = indexes
+        self._length = length
+
+    @property
+    def version(self):
+        return self._version
+
+    def __getitem__(self, obj):
+        index = self._indexes.get(id(obj), self._length)
+        if index >= self._length:
+            raise KeyError(f'{obj!r} is not in snapshot')
+        return self._pages[index // self._page_size][index % self._page_size]
+
+    def __contains__(self, obj):
+        return self._indexes.get(id(obj), self._length) < self._length
+
+    def __iter__(self):
+        for page in self._pages:
+            yield from page
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return f'Snapshot {self._version}: {self._length} objects'
+
+
+class SnapshotStore:
+    """
+    Keep state of cars and units in pages and provide O(1) copy-on-write snapshots of it.
+
+    Store subscribes to state changes of added objects. Taking snapshot only marks current pages
+    as shared; page is copied on first change after snapshot, so only changed pages are copied.
+
+    Usage:
+    :>>> car = Car(100.0, 0.9, Point(1.0, 1.0), 'BMW')
+    :>>> store = SnapshotStore([car])
+    :>>> car.refill(80)
+    :>>> snapshot = store.snapshot()
+    :>>> car.drive(5.0, 5.0)
+    :>>> print(snapshot[car].fuel_amount)
+    80.0
+    :>>> print(store.snapshot()[car].x)
+    5.0
+    """
+
+    def __init__(self, objects=(), page_size=1024):
+        """
+        The initializer.
+
+        :param objects: Cars and units to be tracked
+        :type objects: Iterable of Car or Unit
+        :param page_size: Number of states in one page. By default: 1024.
+        :type page_size: int
+        :raise ValueError: If page_size is not positive
+        :raise TypeError: If object is not of Car or Unit type
+        """
+
+        if page_size <= 0:
+            raise ValueError('Page size should be positive!')
+
+        self._page_size = page_size
+        self._pages = []
+        self._page_versions = []
+        self._pages_shared = False
+        self._indexes = {}
+        self._objects = []
+        self._version = 0
+        self._lock = Lock()
+
+        for obj in objects:
+            self.add(obj)
+
+    @property
+    def version(self):
+        return self._version
+
+    def _own_pages(self):
+        """
+        Make list of pages writable: copy it if it is shared with snapshot. Should be called under lock.
+
+        :return: None
+        :rtype: None
+        """
+
+        if self._pages_shared:
+            self._pages = list(self._pages)
+            self._page_versions = list(self._page_versions)
+            self._pages_shared = False
+
+    def _own_page(self, number):
+        """
+        Make page writable: copy it if it is shared with snapshot. Should be called under lock.
+
+        :param number: Number of page
+        :type number: int
+        :return: page which can be modified
+        :rtype: list
+        """
+
+        self._own_pages()
+        if self._page_versions[number] != self._version:
+            self._pages[number] = list(self._pages[number])
+            self._page_versions[number] = self._version
+        return self._pages[number]
+
+    def add(self, obj):
+        """
+        Start tracking object.
+
+        :param obj: Object to be tracked
+        :type obj: Car or Unit
+        :raise TypeError: If obj is not of Car or Unit type
+        :raise ValueError: If obj is already tracked
+        :return: None
+        :rtype: None
+        """
+
+        state = _state(obj)
+        if id(obj) in self._indexes:
+            raise ValueError(f'{obj!r} is already in store')
+
+        with self._lock:
+            index = len(self._objects)
+            if index % self._page_size == 0:
+                self._own_pages()
+                self._pages.append([])
+                self._page_versions.append(self._version)
+            self._own_page(index // self._page_size).append(state)
+            self._objects.append(obj)
+            self._indexes[id(obj)] = index
+
+        obj.subscribe(self._on_change)
+
+    def _on_change(self, obj, attribute, old, new):
+        index = self._indexes[id(obj)]
+        state = _state(obj)
+        with self._lock:
+            self._own_page(index // self._page_size)[index % self._page_size] = state
+
+    def snapshot(self):
+        """
+        Take snapshot of state of all tracked objects in O(1).
+
+        :return: snapshot of current state
+        :rtype: Snapshot
+        """
+
+        with self._lock:
+            snapshot = Snapshot(self._version, self._pages, self._page_size, self._indexes, len(self._objects))
+            self._pages_shared = True
+            self._version += 1
+        return snapshot
+
+    def close(self):
+        """
+        Stop tracking all objects.
+
+        :return: None
+        :rtype: None
+        """
+
+        for obj in self._objects:
+            obj.unsubscribe(self._on_change)
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __repr__(self):
+        return f'SnapshotStore {self._version}: {len(self)} objects'
@@ -1,19 +1,22 @@
-"""Define Unit class and UnitIsDead exception"""
+"""Define Unit, CompactUnit classes and UnitIsDead exception"""
 
 __author__ = 'santa'
 __all__ = (
     'Unit',
+    'CompactUnit',
     'UnitIsDead'
 )
 
+from copyreg import __newobj__
 from math import fabs
+from src.observable import Observable
 
 
 class UnitIsDead(Exception):
     pass
 
 
-class Unit:
+class Unit(Observable):
     """
     Define Unit with state params and attack, take damage, add hit points capabilities
 
@@ -138,8 +141,6 @@ class Unit:
     def damage(self):
         return self._damage
 
-
-
     def add_hit_points(self, hp):
         """
         Increase hit points after validation of input hp.
@@ -155,10 +156,12 @@ class Unit:
         new_hit_points = self._hit_points + fabs(self._validate_int(hp))
 
         self._ensure_is_alive()
+        old_hit_points = self._hit_points
         if new_hit_points > self._hit_points_limit:
             self._hit_points = self._hit_points_limit
         else:
             self._hit_points = new_hit_points
+        self._notify('hit_points', old_hit_points, self._hit_points)
 
     def _take_damage(self, dmg):
         """
@@ -175,10 +178,12 @@ class Unit:
         dmg = fabs(self._validate_int(dmg))
 
         self._ensure_is_alive()
+        old_hit_points = self._hit_points
         if dmg > self._hit_points:
             self._hit_points = 0
         else:
             self._hit_points -= dmg
+        self._notify('hit_points', old_hit_points, self._hit_points)
 
     def attack(self, enemy):
         """
@@ -228,3 +233,100 @@ class Unit:
             f'hp {self.hit_points}({self.hit_points_limit})'
         )
         return presentation
+
+    def __getstate__(self):
+        return self._name, self._hit_points, self._hit_points_limit, self._damage
+
+    def __setstate__(self, state):
+        self._name, self._hit_points, self._hit_points_limit, self._damage = state
+
+    def __reduce__(self):
+        return __newobj__, (type(self),), self.__getstate__()
+
+
+# Tables are shared by all compact units and never shrink, so they are bounded:
+# values which do not fit are stored as they are and only lose sharing.
+_TABLE_LIMIT = 65536
+_NAMES = {}
+_STATS = {}
+
+
+def _intern(table, value):
+    """
+    Get shared object equal to value, adding value to table if there is room.
+
+    :param table: Table of shared objects
+    :type table: dict
+    :param value: Value to be interned
+    :type value: Hashable
+    :return: shared object equal to value or value itself if table is full
+    """
+
+    interned = table.get(value)
+    if interned is None:
+        if len(table) >= _TABLE_LIMIT:
+            return value
+        interned = table[value] = value
+    return interned
+
+
+def _name_property(attribute):
+    """
+    Create property storing name of unit in attribute, interned in table shared by all units.
+
+    :param attribute: Name of attribute where name is stored
+    :type attribute: str
+    :return: property
+    :rtype: property
+    """
+
+    def getter(self):
+        return getattr(self, attribute)
+
+    def setter(self, value):
+        setattr(self, attribute, _intern(_NAMES, value))
+
+    return property(getter, setter)
+
+
+def _stat_property(attribute):
+    """
+    Create property storing stat of unit in attribute. Integral float stat is interned
+    in table shared by all units, any other stat (e.g. int 0 of dead unit) is stored as it is.
+
+    :param attribute: Name of attribute where stat is stored
+    :type attribute: str
+    :return: property
+    :rtype: property
+    """
+
+    def getter(self):
+        return getattr(self, attribute)
+
+    def setter(self, value):
+        if type(value) is float and value.is_integer():
+            value = _intern(_STATS, value)
+        setattr(self, attribute, value)
+
+    return property(getter, setter)
+
+
+class CompactUnit(Unit):
+    """
+    Unit which takes less memory: names and integral stats are objects shared by all units
+    through common tables, so units do not hold their own copies of them.
+
+    Usage:
+    :>>> archer = CompactUnit('Archer', hit_points=100, damage=10)
+    :>>> other_archer = CompactUnit('Archer')
+    :>>> print(archer.name is other_archer.name)
+    True
+    :>>> print(archer.hit_points)
+    100.0
+    """
+
+    # Properties replace attributes of Unit, so values are stored under other names
+    _name = _name_property('_shared_name')
+    _hit_points = _stat_property('_shared_hit_points')
+    _hit_points_limit = _stat_property('_shared_hit_points_limit')
+    _damage = _stat_property('_shared_damage')
@@ -0,0 +1,150 @@
+__author__ = 'santa'
+
+from src.analytics import *
+from src.car import *
+from src.point import *
+import random
+import unittest
+
+
+class TestQuantileSketch(unittest.TestCase):
+    def setUp(self):
+        self.sketch = QuantileSketch(accuracy=0.01)
+
+    def test_quantile(self):
+        values = [random.uniform(0.1, 1000.0) for _ in range(10000)]
+        for value in values:
+            self.sketch.add(value)
+        values.sort()
+
+        for q in (0.0, 0.1, 0.5, 0.9, 0.99, 1.0):
+            expected = values[int(q * (len(values) - 1))]
+            self.assertAlmostEqual(self.sketch.quantile(q), expected, delta=expected * 0.011)
+
+        self.assertEqual(self.sketch.count, 10000)
+
+    def test_zeros_and_errors(self):
+        with self.assertRaises(ValueError):
+            self.sketch.quantile(0.5)
+
+        self.sketch.add(0.0)
+        self.sketch.add(0.0)
+        self.sketch.add(10.0)
+        self.assertEqual(self.sketch.quantile(0.5), 0.0)
+        self.assertAlmostEqual(self.sketch.quantile(1.0), 10.0, delta=0.1)
+
+        with self.assertRaises(ValueError):
+            self.sketch.add(-1.0)
+        self.assertEqual(self.sketch.count, 3)
+        with self.assertRaises(ValueError):
+            self.sketch.quantile(1.5)
+        with self.assertRaises(ValueError):
+            QuantileSketch(accuracy=1.0)
+
+    def test_bounded_merge(self):
+        sketch = QuantileSketch(max_bins=10)
+        other = QuantileSketch(max_bins=10)
+        for value in range(1, 1000):
+            sketch.add(value)
+            other.add(value * 2)
+        sketch.merge(other)
+
+        self.assertEqual(len(sketch), 10)
+        self.assertEqual(sketch.count, 1998)
+        self.assertAlmostEqual(sketch.quantile(1.0), 1998.0, delta=20.0)
+
+        with self.assertRaises(ValueError):
+            sketch.merge(QuantileSketch(accuracy=0.05))
+
+    def test_saturated(self):
+        sketch = QuantileSketch(max_bins=100)
+        values = [1.1 ** power for power in range(2000, 0, -1)]
+        for value in values:
+            sketch.add(value)
+
+        self.assertEqual(len(sketch), 100)
+        self.assertEqual(sketch.count, 2000)
+        self.assertAlmostEqual(sketch.quantile(1.0), values[0], delta=values[0] * 0.011)
+        self.assertAlmostEqual(sketch.quantile(0.99), values[20], delta=values[20] * 0.011)
+
+        other = QuantileSketch(max_bins=100)
+        other.add(0.001)
+        other.merge(sketch)
+        self.assertEqual(len(other), 100)
+        self.assertEqual(other.count, 2001)
+        self.assertAlmostEqual(other.quantile(1.0), values[0], delta=values[0] * 0.011)
+
+    def tearDown(self):
+        pass
+
+
+class TestFuelEconomyStream(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.stream = FuelEconomyStream(window=60.0, buckets=6, clock=lambda: self.now)
+        self.bmw = Car(100.0, 0.5, Point(0.0, 0.0), 'BMW')
+        self.taz = Car(50.0, 1.0, Point(0.0, 0.0), 'Taz')
+        self.stream.add(self.bmw)
+        self.stream.add(self.taz)
+
+    def test_statistics(self):
+        self.bmw.refill(50)
+        self.bmw.drive(3.0, 4.0)
+        self.bmw.drive(3.0, 14.0)
+        self.taz.refill(20)
+        self.taz.drive(0.0, 2.0)
+
+        snapshot = self.stream.snapshot(quantiles=(0.5,))
+        bmw, taz = snapshot['BMW'], snapshot['Taz']
+
+        self.assertEqual(bmw['distance'].count, 2)
+        self.assertEqual(bmw['distance'].total, 15.0)
+        self.assertEqual(bmw['distance'].mean, 7.5)
+        self.assertEqual(bmw['fuel_used'].total, 7.5)
+        self.assertEqual(bmw['refill'], MetricSummary(1, 50.0, 50.0, {0.5: bmw['refill'].quantiles[0.5]}))
+        self.assertAlmostEqual(bmw['refill'].quantiles[0.5], 50.0, delta=0.5)
+        self.assertEqual(taz['fuel_used'].total, 2.0)
+        self.assertEqual(taz['refill'].total, 20.0)
+
+        with self.assertRaises(Warning):
+            self.taz.drive(100.0, 100.0)
+        self.assertEqual(self.stream.snapshot()['Taz']['distance'].count, 1)
+
+    def test_window(self):
+        self.bmw.refill(10)
+        self.now = 30.0
+        self.bmw.refill(20)
+        self.assertEqual(self.stream.snapshot()['BMW']['refill'].total, 30.0)
+
+        self.now = 65.0
+        snapshot = self.stream.snapshot()['BMW']
+        self.assertEqual(snapshot['refill'].total, 20.0)
+        self.assertEqual(snapshot['distance'], MetricSummary(0, 0.0, 0.0, {0.5: None, 0.9: None, 0.99: None}))
+
+        self.now = 1000.0
+        self.bmw.refill(5)
+        self.assertEqual(self.stream.snapshot()['BMW']['refill'].total, 5.0)
+        self.assertEqual(len(self.stream._buckets), 3)
+
+    def test_add_remove(self):
+        with self.assertRaises(TypeError):
+            self.stream.add(Point(0.0, 0.0))
+        with self.assertRaises(ValueError):
+            self.stream.add(self.bmw)
+
+        self.stream.remove(self.bmw)
+        self.bmw.refill(10)
+        self.assertEqual(len(self.stream), 1)
+        self.assertEqual(self.stream.snapshot(), {})
+
+        with self.assertRaises(KeyError):
+            self.stream.remove(self.bmw)
+        with self.assertRaises(ValueError):
+            FuelEconomyStream(window=0)
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,9 +2,15 @@ __author__ = 'santa'
 
 from src.car import *
 from src.point import *
+import copy
+import pickle
 import unittest
 
 
+class Truck(Car):
+    pass
+
+
 class TestCar(unittest.TestCase):
     def setUp(self):
         self.car_default = Car()
@@ -71,6 +77,46 @@ class TestCar(unittest.TestCase):
         with self.assertRaises(Warning):
             self.car_default.drive(c)
 
+    def test_observers(self):
+        changes = []
+        observer = lambda car, attribute, old, new: changes.append((attribute, old, new))
+        self.car_default.subscribe(observer)
+
+        self.car_default.refill(10.0)
+        self.car_default.drive(3.0, 4.0)
+        with self.assertRaises(Warning):
+            self.car_default.drive(300.0, 400.0)
+
+        self.assertEqual(changes, [
+            ('fuel_amount', 0.0, 10.0),
+            ('fuel_amount', 10.0, 10.0 - 0.6 * 5.0),
+            ('location', Point(0.0, 0.0), Point(3.0, 4.0)),
+        ])
+
+        self.car_default.unsubscribe(observer)
+        self.car_default.refill(10.0)
+        self.assertEqual(len(changes), 3)
+        with self.assertRaises(ValueError):
+            self.car_default.unsubscribe(observer)
+
+    def test_pickle(self):
+        self.car_taz.refill(20.0)
+        self.car_taz.subscribe(print)
+        restored = pickle.loads(pickle.dumps(self.car_taz))
+
+        self.assertEqual(repr(restored), repr(self.car_taz))
+        self.assertEqual(restored.location, self.car_taz.location)
+        self.assertIsNot(restored.location, self.car_taz.location)
+        self.assertNotIn('_observers', restored.__dict__)
+
+        restored.drive(11.0, 10.0)
+        self.assertEqual(restored.fuel_amount, 19.1)
+
+        truck = pickle.loads(pickle.dumps(Truck(model='Kamaz')))
+        self.assertIs(type(truck), Truck)
+        self.assertEqual(truck.model, 'Kamaz')
+        self.assertIs(type(copy.deepcopy(Truck())), Truck)
+
     def test_str_repr(self):
         self.assertEqual(
             str(self.car_default),
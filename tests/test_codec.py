@@ -0,0 +1,76 @@
+__author__ = 'santa'
+
+from src.codec import *
+from src.car import *
+from src.point import *
+from src.unit import *
+import pickle
+import unittest
+
+
+class TestCodec(unittest.TestCase):
+    def setUp(self):
+        self.points = [Point(1.0, 2.0), Point(-3.5, 4.25)]
+        self.cars = [Car(), Car(50, 0.9, Point(10.0, 10.0), 'Taz'), Car(model='Taz')]
+        self.cars[1].refill(20)
+        self.units = [Unit('Archer', 100, 20), Unit('Knight'), Unit('Archer')]
+        self.units[1].attack(self.units[0])
+
+    def test_round_trip(self):
+        self.assertEqual(unpack_many(pack_many(self.points)), self.points)
+
+        cars = unpack_many(pack_many(self.cars))
+        self.assertEqual([repr(car) for car in cars], [repr(car) for car in self.cars])
+        self.assertEqual(cars[1].location, Point(10.0, 10.0))
+        cars[1].drive(11.0, 10.0)
+        self.assertEqual(cars[1].fuel_amount, 19.1)
+
+        units = unpack_many(pack_many(self.units))
+        self.assertEqual([unit.__getstate__() for unit in units], [unit.__getstate__() for unit in self.units])
+
+        compact_units = unpack_many(pack_many([CompactUnit('Archer'), CompactUnit('Archer', 100)]))
+        self.assertEqual(type(compact_units[1]), CompactUnit)
+        self.assertEqual(compact_units[1].hit_points, 100.0)
+        self.assertIs(compact_units[0].name, compact_units[1].name)
+
+        self.assertEqual(unpack_many(pack_many([])), [])
+
+    def test_strings(self):
+        cars = unpack_many(pack_many([Car(model=''), Car(model='a\0b'), Car(model='Модель'), Car(model='')]))
+        self.assertEqual([car.model for car in cars], ['', 'a\0b', 'Модель', ''])
+
+        units = unpack_many(pack_many([Unit(''), Unit('\0'), Unit('Archer')]))
+        self.assertEqual([unit.name for unit in units], ['', '\0', 'Archer'])
+
+    def test_size(self):
+        cars = [Car(model=model) for model in ('BMW', 'Taz') * 100]
+        packed = pack_many(cars)
+
+        self.assertEqual(packed.count(b'Taz'), 1)
+        self.assertLess(len(packed), len(pickle.dumps(cars)))
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            pack_many(self.points + self.cars)
+        with self.assertRaises(TypeError):
+            pack_many([1.0, 2.0])
+
+        packed = pack_many(self.cars)
+        with self.assertRaises(ValueError):
+            unpack_many(packed[:-1])
+        with self.assertRaises(ValueError):
+            unpack_many(packed[:5])
+        with self.assertRaises(ValueError):
+            unpack_many(b'XXXX' + packed[4:])
+
+        corrupt = bytearray(pack_many([Unit('Archer')]))
+        corrupt[-28:-24] = (5).to_bytes(4, 'little')
+        with self.assertRaises(ValueError):
+            unpack_many(bytes(corrupt))
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
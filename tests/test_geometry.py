@@ -0,0 +1,95 @@
+__author__ = 'santa'
+
+from src.geometry import *
+from src.point import *
+import unittest
+
+
+class TestGeometry(unittest.TestCase):
+    def setUp(self):
+        self.points = [
+            Point(0.0, 0.0),
+            Point(4.0, 0.0),
+            Point(2.0, 1.0),
+            Point(4.0, 4.0),
+            Point(2.0, 4.0),
+            Point(0.0, 4.0),
+            Point(1.0, 2.0),
+        ]
+        self.array = PointArray.from_points(self.points)
+
+    def test_point_array(self):
+        self.assertEqual(len(self.array), 7)
+        self.assertEqual(self.array[3], Point(4.0, 4.0))
+        self.assertEqual(list(self.array), self.points)
+
+        self.array.append(Point(9.0, 9.0))
+        self.assertEqual(self.array[-1], Point(9.0, 9.0))
+
+        with self.assertRaises(ValueError):
+            PointArray([1.0, 2.0], [1.0])
+        with self.assertRaises(TypeError):
+            PointArray(['incorrect data'], [1.0])
+
+    def test_bounding_box(self):
+        for points in (self.points, self.array):
+            lower, upper = bounding_box(points)
+            self.assertEqual(lower, Point(0.0, 0.0))
+            self.assertEqual(upper, Point(4.0, 4.0))
+
+        with self.assertRaises(ValueError):
+            bounding_box([])
+
+    def test_centroid(self):
+        self.assertEqual(centroid([Point(0.0, 0.0), Point(4.0, 2.0)]), Point(2.0, 1.0))
+        self.assertEqual(centroid(self.array), centroid(self.points))
+
+        with self.assertRaises(ValueError):
+            centroid(PointArray())
+
+    def test_convex_hull(self):
+        expected = [Point(0.0, 0.0), Point(4.0, 0.0), Point(4.0, 4.0), Point(0.0, 4.0)]
+        self.assertEqual(convex_hull(self.points), expected)
+        self.assertEqual(convex_hull(self.array), expected)
+
+        self.assertEqual(convex_hull([Point(1.0, 1.0), Point(1.0, 1.0)]), [Point(1.0, 1.0)])
+        self.assertEqual(
+            convex_hull([Point(0.0, 0.0), Point(1.0, 1.0), Point(2.0, 2.0)]),
+            [Point(0.0, 0.0), Point(2.0, 2.0)]
+        )
+
+        with self.assertRaises(ValueError):
+            convex_hull([])
+
+    def test_streaming_bounding_box(self):
+        box = BoundingBox()
+        with self.assertRaises(ValueError):
+            box.lower
+
+        for index, point in enumerate(self.points):
+            box.update(index, point)
+        self.assertEqual(box.lower, Point(0.0, 0.0))
+        self.assertEqual(box.upper, Point(4.0, 4.0))
+
+        box.update(0, Point(-1.0, 1.0))
+        self.assertEqual(box.lower, Point(-1.0, 0.0))
+
+        box.update(3, Point(3.0, 3.0))
+        box.remove(0)
+        self.assertEqual(box.lower, Point(0.0, 0.0))
+        self.assertEqual(box.upper, Point(4.0, 4.0))
+
+        for index in range(1, 7):
+            box.remove(index)
+        self.assertEqual(len(box), 0)
+        with self.assertRaises(ValueError):
+            box.upper
+        with self.assertRaises(KeyError):
+            box.remove(0)
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+__author__ = 'santa'
+
+from pathlib import Path
+import subprocess
+import sys
+import unittest
+
+ROOT = Path(__file__).resolve().parent.parent
+COLD_IMPORT_BUDGET = 0.1
+COLD_IMPORT_RUNS = 5
+
+COLD_IMPORT = '''
+import sys, time
+start = time.perf_counter()
+from src import Point, Car, Unit
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(' '.join(sorted(sys.modules)))
+'''
+
+
+class TestImport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        runs = [
+            subprocess.run(
+                [sys.executable, '-c', COLD_IMPORT], cwd=ROOT, capture_output=True, text=True, check=True
+            ).stdout.splitlines()
+            for _ in range(COLD_IMPORT_RUNS)
+        ]
+        # Best of several runs: noise from a loaded machine only ever adds time
+        cls.elapsed = min(float(output[0]) for output in runs)
+        cls.modules = set(runs[0][1].split())
+
+    def test_cold_import_budget(self):
+        self.assertLess(self.elapsed, COLD_IMPORT_BUDGET)
+
+    def test_optional_modules_are_lazy(self):
+        for module in ('src.geometry', 'src.shared', 'src.snapshot', 'src.registry', 'src.codec', 'src.analytics', 'multiprocessing', 'array'):
+            self.assertNotIn(module, self.modules)
+
+    def test_lazy_exports(self):
+        import src
+
+        self.assertIs(src.Point, __import__('src.point').point.Point)
+        self.assertIs(src.SnapshotStore, __import__('src.snapshot').snapshot.SnapshotStore)
+        self.assertIn('convex_hull', dir(src))
+        with self.assertRaises(AttributeError):
+            src.Missing
+
+
+if __name__ == '__main__':
+    unittest.main()
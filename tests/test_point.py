@@ -1,10 +1,16 @@
 __author__ = 'santa'
 
 from src.point import *
+import copy
+import pickle
 import unittest
 import math
 
 
+class Pixel(Point):
+    pass
+
+
 class TestPoint(unittest.TestCase):
     def setUp(self):
         self.a = Point(10.5, 20.5)
@@ -50,6 +56,17 @@ class TestPoint(unittest.TestCase):
             math.sqrt((c.x - b.x) ** 2 + (c.y - b.y) ** 2)
         )
 
+    def test_pickle(self):
+        restored = pickle.loads(pickle.dumps(self.a))
+
+        self.assertIsNot(restored, self.a)
+        self.assertEqual(restored, self.a)
+        self.assertEqual(restored.__dict__, {'_x': 10.5, '_y': 20.5})
+
+        pixel = pickle.loads(pickle.dumps(Pixel(1.0, 2.0)))
+        self.assertIs(type(pixel), Pixel)
+        self.assertIs(type(copy.copy(Pixel(1.0, 2.0))), Pixel)
+
     def test_str_repr(self):
         self.assertEqual('(10.5, 20.5)', str(self.a))
         self.assertEqual('Point (10.5, 20.5)', repr(self.a))
@@ -0,0 +1,124 @@
+__author__ = 'santa'
+
+from src.registry import *
+from src.car import *
+from src.point import *
+from src.unit import *
+import src.registry as registry_module
+import unittest
+
+
+class TestFleet(unittest.TestCase):
+    def setUp(self):
+        self.bmw = Car(100.0, 1.0, Point(0.0, 0.0), 'BMW')
+        self.taz = Car(50.0, 1.0, Point(0.0, 0.0), 'Taz')
+        self.other_bmw = Car(100.0, 0.5, Point(0.0, 0.0), 'BMW')
+        self.fleet = Fleet([self.bmw, self.taz], verify=True)
+
+    def test_init(self):
+        self.assertEqual(len(self.fleet), 2)
+        self.assertIn(self.bmw, self.fleet)
+        self.assertNotIn(self.other_bmw, self.fleet)
+        self.assertEqual(self.fleet.fuel_amount, 0.0)
+
+        with self.assertRaises(TypeError):
+            Fleet([Unit('Archer')])
+        with self.assertRaises(ValueError):
+            self.fleet.add(self.bmw)
+
+    def test_aggregates(self):
+        self.bmw.refill(60)
+        self.taz.refill(30)
+        self.other_bmw.refill(40)
+        self.fleet.add(self.other_bmw)
+
+        self.assertEqual(self.fleet.fuel_amount, 130.0)
+        self.assertEqual(self.fleet.fuel_amount_by_model['BMW'], 100.0)
+
+        self.bmw.drive(3.0, 4.0)
+        self.other_bmw.drive(6.0, 8.0)
+        self.assertEqual(self.fleet.fuel_amount, 120.0)
+        self.assertEqual(dict(self.fleet.fuel_amount_by_model), {'BMW': 90.0, 'Taz': 30.0})
+
+        self.fleet.remove(self.bmw)
+        self.bmw.refill(10)
+        self.assertEqual(self.fleet.fuel_amount, 65.0)
+        self.assertEqual(self.fleet.fuel_amount_by_model['BMW'], 35.0)
+
+        with self.assertRaises(KeyError):
+            self.fleet.remove(self.bmw)
+        with self.assertRaises(TypeError):
+            self.fleet.fuel_amount_by_model['BMW'] = 0.0
+
+    def test_verify(self):
+        unverified = Fleet([self.taz])
+        self.taz.refill(30)
+        self.fleet.verify()
+        unverified.verify()
+
+        self.taz._fuel_amount = 10.0
+        with self.assertRaises(AggregateMismatch):
+            self.fleet.fuel_amount
+        with self.assertRaises(AggregateMismatch):
+            self.fleet.fuel_amount_by_model
+
+        self.assertEqual(unverified.fuel_amount, 30.0)
+        with self.assertRaises(AggregateMismatch):
+            unverified.verify()
+
+    def test_incomplete_registry(self):
+        class Garage(registry_module._Registry):
+            _type = Car
+
+            def _include(self, obj):
+                pass
+
+        with self.assertRaises(TypeError):
+            Garage([self.bmw])
+
+    def tearDown(self):
+        pass
+
+
+class TestArmy(unittest.TestCase):
+    def setUp(self):
+        self.soldier = Unit('Soldier', 100, 20)
+        self.sergeant = Unit('Sergeant')
+        self.army = Army([self.soldier, self.sergeant], verify=True)
+
+    def test_aggregates(self):
+        self.assertEqual(self.army.hit_points, 300.0)
+        self.assertEqual(self.army.mean_hit_points, 150.0)
+        self.assertEqual(self.army.alive, 2)
+
+        self.sergeant.attack(self.soldier)
+        self.assertEqual(self.army.hit_points, 250.0)
+
+        self.soldier.add_hit_points(30)
+        self.sergeant.attack(self.soldier)
+        self.sergeant.attack(self.soldier)
+        with self.assertRaises(UnitIsDead):
+            self.sergeant.attack(self.soldier)
+
+        self.assertEqual(self.army.alive, 1)
+        self.assertEqual(self.army.hit_points, 170.0)
+        self.assertEqual(self.army.mean_hit_points, 85.0)
+
+        self.army.remove(self.sergeant)
+        self.army.remove(self.soldier)
+        self.assertEqual(self.army.hit_points, 0.0)
+        self.assertEqual(self.army.mean_hit_points, 0.0)
+        self.assertEqual(self.army.alive, 0)
+
+    def test_verify(self):
+        self.army.verify()
+        self.soldier._hit_points = 0
+        with self.assertRaises(AggregateMismatch):
+            self.army.alive
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
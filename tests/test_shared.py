@@ -0,0 +1,136 @@
+__author__ = 'santa'
+
+from src.shared import *
+from src.car import *
+from src.point import *
+from multiprocessing import get_context
+from os.path import dirname
+from time import sleep
+import subprocess
+import sys
+import unittest
+
+
+def _total_fuel(name):
+    with SharedFleet.attach(name) as fleet:
+        return sum(fleet.column('fuel_amount'))
+
+
+class TestShared(unittest.TestCase):
+    def setUp(self):
+        self.points = SharedPoints.create(None, [Point(1.0, 2.0), Point(3.0, 4.0)])
+        self.fleet = SharedFleet.create(None, [Car(), Car(50, 0.9, Point(10.0, 10.0), 'Taz')])
+
+    def test_points(self):
+        reader = SharedPoints.attach(self.points.name)
+
+        self.assertEqual(len(reader), 2)
+        self.assertTrue(reader.readonly)
+        self.assertEqual(reader[1], Point(3.0, 4.0))
+        self.assertEqual(reader[-1], Point(3.0, 4.0))
+
+        self.points[1] = Point(5.0, 6.0)
+        self.assertEqual(reader.read(1), (5.0, 6.0))
+
+        self.points[0].x = 7.0
+        self.assertEqual(reader[0].x, 7.0)
+        self.assertEqual(reader[0].distance(Point(7.0, 4.0)), 2.0)
+
+        with self.assertRaises(PermissionError):
+            reader[0].x = 1.0
+        with self.assertRaises(PermissionError):
+            reader[0] = Point(1.0, 1.0)
+        with self.assertRaises(IndexError):
+            reader[2]
+
+        reader.close()
+
+    def test_fleet(self):
+        reader = SharedFleet.attach(self.fleet.name)
+
+        self.assertEqual(reader.models, ('Mercedes', 'Taz'))
+        self.assertEqual(reader[0].model, 'Mercedes')
+        self.assertEqual(reader[1].model, 'Taz')
+        self.assertEqual(reader[1].fuel_capacity, 50.0)
+        self.assertEqual(reader[1].fuel_consumption, 0.9)
+
+        car = self.fleet[1]
+        car.refill(20)
+        car.drive(11.0, 10.0)
+        self.assertEqual(reader[1].location, Point(11.0, 10.0))
+        self.assertAlmostEqual(reader[1].fuel_amount, 19.1)
+        self.assertEqual(str(reader[1]), str(car))
+
+        with self.assertRaises(Warning):
+            car.drive(1000.0, 1000.0)
+        self.assertEqual(reader.read(1)[3:5], (11.0, 10.0))
+        self.assertEqual(self.fleet._header[0] % 2, 0)
+
+        with self.assertRaises(PermissionError):
+            reader[1].refill(10)
+        with self.assertRaises(PermissionError):
+            reader.unlink()
+
+        del car
+        reader.close()
+
+    def test_observers(self):
+        changes = []
+        car = self.fleet[1]
+        car.subscribe(lambda car, attribute, old, new: changes.append((attribute, str(old), str(new))))
+
+        car.refill(20)
+        car.drive(13.0, 14.0)
+
+        self.assertEqual(changes[-1], ('location', '(10.0, 10.0)', '(13.0, 14.0)'))
+        self.assertEqual(changes[1], ('fuel_amount', '20.0', str(20.0 - 0.9 * 5.0)))
+        del car
+
+    def test_models_string_table(self):
+        cars = [Car(model=''), Car(model='a\0b'), Car(model='Taz'), Car(model='Модель')]
+        with SharedFleet.create(None, cars) as fleet:
+            reader = SharedFleet.attach(fleet.name)
+            self.assertEqual([reader[index].model for index in range(4)], ['', 'a\0b', 'Taz', 'Модель'])
+            reader.close()
+            fleet.unlink()
+
+    def test_read_inside_writing(self):
+        with self.fleet.writing():
+            self.assertEqual(self.fleet.read(1)[3:5], (10.0, 10.0))
+
+        reader = SharedFleet.attach(self.fleet.name)
+        self.fleet._header[0] += 1
+        with self.assertRaises(TimeoutError):
+            reader.read(0, timeout=0.01)
+        self.fleet._header[0] += 1
+        self.assertEqual(reader.read(0, timeout=0.01)[0], 60.0)
+        reader.close()
+
+    def test_other_process(self):
+        self.fleet[0].refill(30)
+        self.fleet[1].refill(15)
+
+        with get_context('spawn').Pool(1) as pool:
+            self.assertEqual(pool.apply(_total_fuel, (self.fleet.name,)), 45.0)
+
+    def test_unrelated_process(self):
+        with SharedFleet.create(None, [Car()]) as fleet:
+            code = f'from src.shared import SharedFleet; SharedFleet.attach({fleet.name!r}).close()'
+            subprocess.run([sys.executable, '-c', code], cwd=dirname(dirname(__file__)), check=True)
+
+            for _ in range(10):
+                sleep(0.05)
+                SharedFleet.attach(fleet.name).close()
+            fleet.unlink()
+
+        with self.assertRaises(FileNotFoundError):
+            SharedFleet.attach(fleet.name)
+
+    def tearDown(self):
+        for buffer in (self.points, self.fleet):
+            buffer.close()
+            buffer.unlink()
+
+
+if __name__ == '__main__':
+    unittest.main()
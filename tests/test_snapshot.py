@@ -0,0 +1,86 @@
+__author__ = 'santa'
+
+from src.snapshot import *
+from src.car import *
+from src.point import *
+from src.unit import *
+import unittest
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.cars = [Car(100.0, 1.0, Point(0.0, 0.0), 'BMW') for _ in range(5)]
+        self.units = [Unit('Soldier', 100, 20) for _ in range(5)]
+        for car in self.cars:
+            car.refill(50)
+        self.store = SnapshotStore(self.cars + self.units, page_size=2)
+
+    def test_init(self):
+        self.assertEqual(len(self.store), 10)
+        self.assertEqual(len(self.store._pages), 5)
+
+        with self.assertRaises(ValueError):
+            SnapshotStore(page_size=0)
+        with self.assertRaises(TypeError):
+            self.store.add(Point(0.0, 0.0))
+        with self.assertRaises(ValueError):
+            self.store.add(self.cars[0])
+
+    def test_isolation(self):
+        snapshot = self.store.snapshot()
+
+        self.cars[0].drive(3.0, 4.0)
+        self.units[0].attack(self.units[1])
+        self.cars[4].refill(10)
+
+        self.assertEqual(snapshot[self.cars[0]], CarState(50.0, 0.0, 0.0))
+        self.assertEqual(snapshot[self.cars[4]].fuel_amount, 50.0)
+        self.assertEqual(snapshot[self.units[0]], UnitState(100.0))
+        self.assertEqual(snapshot[self.units[1]], UnitState(100.0))
+
+        current = self.store.snapshot()
+        self.assertEqual(current[self.cars[0]], CarState(45.0, 3.0, 4.0))
+        self.assertEqual(current[self.cars[4]].fuel_amount, 60.0)
+        self.assertEqual(current[self.units[0]].hit_points, 90.0)
+        self.assertEqual(current[self.units[1]].hit_points, 80.0)
+        self.assertEqual(current.version, snapshot.version + 1)
+
+        self.assertEqual(len(list(snapshot)), 10)
+        self.assertEqual(snapshot[self.cars[1]], current[self.cars[1]])
+
+    def test_copy_on_write(self):
+        snapshot = self.store.snapshot()
+        self.assertIs(snapshot._pages, self.store._pages)
+
+        self.cars[0].refill(10)
+        self.assertIsNot(snapshot._pages[0], self.store._pages[0])
+        for number in range(1, 5):
+            self.assertIs(snapshot._pages[number], self.store._pages[number])
+
+        self.cars[1].refill(10)
+        current = self.store.snapshot()
+        self.assertIs(current._pages[0], self.store._pages[0])
+
+    def test_add_after_snapshot(self):
+        snapshot = self.store.snapshot()
+        unit = Unit('Archer')
+        self.store.add(unit)
+
+        self.assertEqual(len(snapshot), 10)
+        self.assertNotIn(unit, snapshot)
+        with self.assertRaises(KeyError):
+            snapshot[unit]
+        self.assertIn(unit, self.store.snapshot())
+
+    def test_close(self):
+        self.store.close()
+        snapshot = self.store.snapshot()
+        self.cars[0].refill(10)
+        self.assertEqual(self.store.snapshot()[self.cars[0]], snapshot[self.cars[0]])
+
+    def tearDown(self):
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 __author__ = 'santa'
 
 from src.unit import *
+import src.unit as unit_module
+import pickle
 import unittest
 
 
@@ -95,6 +97,23 @@ class TestUnit(unittest.TestCase):
         self.assertEqual(self.sergeant._hit_points, 180)
         self.assertEqual(self.soldier._hit_points, 0)
 
+    def test_observers(self):
+        changes = []
+        self.soldier.subscribe(lambda unit, attribute, old, new: changes.append((unit, old, new)))
+
+        self.sergeant.attack(self.soldier)
+        self.soldier.add_hit_points(10)
+
+        self.assertEqual(changes, [(self.soldier, 100, 60), (self.soldier, 60, 70)])
+
+    def test_pickle(self):
+        self.sergeant.attack(self.soldier)
+        restored = pickle.loads(pickle.dumps(self.soldier))
+
+        self.assertIs(type(restored), type(self.soldier))
+        self.assertEqual(repr(restored), repr(self.soldier))
+        self.assertEqual(restored.__getstate__(), ('Soldier', 60.0, 100.0, 20.0))
+
     def test_str_repr(self):
         self.assertEqual(
             str(self.soldier),
@@ -111,5 +130,54 @@ class TestUnit(unittest.TestCase):
         pass
 
 
+class TestCompactUnit(TestUnit):
+    def setUp(self):
+        self.soldier = CompactUnit('Soldier', 100, 20)
+        self.sergeant = CompactUnit('Sergeant')
+
+    def test_compact_storage(self):
+        other_soldier = CompactUnit(''.join(['Sol', 'dier']), 100, 20)
+
+        self.assertIs(other_soldier.name, self.soldier.name)
+        self.assertIs(other_soldier.hit_points, self.soldier.hit_points)
+        self.assertIs(other_soldier.damage, self.soldier.damage)
+        self.assertIs(type(self.soldier.damage), float)
+
+    def test_mixed_attack(self):
+        unit = Unit('Sergeant')
+        unit.attack(self.soldier)
+        self.sergeant.attack(self.soldier)
+
+        self.assertEqual(unit.hit_points, self.sergeant.hit_points)
+        self.assertEqual(self.soldier.hit_points, 20.0)
+
+    def test_dead_str_repr(self):
+        unit = Unit('Soldier', 100, 20)
+        for soldier in (unit, self.soldier):
+            self.sergeant.attack(soldier)
+            self.sergeant.attack(soldier)
+            with self.assertRaises(UnitIsDead):
+                self.sergeant.attack(soldier)
+
+        self.assertEqual(self.soldier.hit_points, 0)
+        self.assertIs(type(self.soldier.hit_points), type(unit.hit_points))
+        self.assertEqual(str(self.soldier), str(unit))
+        self.assertEqual(repr(self.soldier), repr(unit))
+        self.assertEqual(repr(self.soldier), 'Unit: Soldier(dmg 20.0), hp 0(100.0)')
+
+    def test_bounded_tables(self):
+        self.soldier._hit_points = 12.5
+        self.assertEqual(self.soldier.hit_points, 12.5)
+        self.assertNotIn(12.5, unit_module._STATS)
+
+        limit, unit_module._TABLE_LIMIT = unit_module._TABLE_LIMIT, len(unit_module._NAMES)
+        try:
+            unit = CompactUnit(''.join(['Unique', 'Name']))
+            self.assertEqual(unit.name, 'UniqueName')
+            self.assertNotIn('UniqueName', unit_module._NAMES)
+        finally:
+            unit_module._TABLE_LIMIT = limit
+
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()